@@ -1,9 +1,12 @@
 import os
 import tempfile
-from fastapi import APIRouter, UploadFile, File, HTTPException, Depends
+from fastapi import APIRouter, UploadFile, File, HTTPException, Depends, Request, Response
 from fastapi.security import HTTPBearer
+from app.core.codec import MSGPACK_MEDIA_TYPE, accepts_msgpack, encode_comic, pack
 from app.services.comic_service import comic_service
-from app.schemas.comic import ComicUploadRequest, ComicUploadResponse, ComicResponse, ComicsListResponse
+from app.services.ingestion_scheduler import ingestion_scheduler, LANES
+from app.schemas.comic import ComicUploadRequest, ComicResponse, ComicsListResponse
+from app.schemas.ingestion import IngestionJobResponse, IngestionJobsListResponse
 
 router = APIRouter(prefix="/comics", tags=["comics"])
 security = HTTPBearer()
@@ -15,47 +18,98 @@ def get_current_user_id(token: str = Depends(security)) -> str:
     return "00000000-0000-0000-0000-000000000001"
 
 
-@router.post("/upload", response_model=ComicUploadResponse)
+def wants_msgpack(request: Request) -> bool:
+    """Check whether the client negotiated the binary response format"""
+    return accepts_msgpack(request.headers.get("accept", ""))
+
+
+def msgpack_response(payload: dict) -> Response:
+    return Response(
+        content=pack(payload),
+        media_type=MSGPACK_MEDIA_TYPE,
+        headers={"Vary": "Accept"}
+    )
+
+
+@router.post("/upload", response_model=IngestionJobResponse, status_code=202)
 async def upload_comic(
     title: str,
     file: UploadFile = File(...),
+    lane: str = "interactive",
     user_id: str = Depends(get_current_user_id)
 ):
-    """Upload and process a comic PDF"""
+    """Upload a comic PDF and queue it for processing"""
     
     if not file.filename.endswith('.pdf'):
         raise HTTPException(status_code=400, detail="Only PDF files are supported")
     
-    # Save uploaded file temporarily
+    if lane not in LANES:
+        raise HTTPException(status_code=400, detail=f"Lane must be one of: {', '.join(LANES)}")
+    
+    # Save uploaded file temporarily - the ingestion job removes it when done
     with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as temp_file:
         content = await file.read()
         temp_file.write(content)
         temp_file_path = temp_file.name
     
     try:
-        # Process comic
-        comic = comic_service.upload_comic(temp_file_path, title, user_id)
+        job = comic_service.submit_comic(temp_file_path, title, user_id, lane)
         
-        return ComicUploadResponse(
-            comic=comic,
-            message="Comic uploaded and processed successfully"
+        return IngestionJobResponse(
+            job=job,
+            message="Comic queued for processing"
         )
     
+    except ValueError as e:
+        # Unreadable PDF or a comic with no pages
+        os.unlink(temp_file_path)
+        raise HTTPException(status_code=400, detail=str(e))
+    
     except Exception as e:
+        os.unlink(temp_file_path)
         raise HTTPException(status_code=500, detail=f"Failed to process comic: {str(e)}")
+
+
+# Plain def so status polls run in the threadpool instead of waiting on the
+# scheduler lock inside the event loop
+@router.get("/jobs", response_model=IngestionJobsListResponse)
+def get_user_jobs(
+    user_id: str = Depends(get_current_user_id)
+):
+    """Get processing status for the current user's uploads"""
+    jobs = ingestion_scheduler.get_user_jobs(user_id)
     
-    finally:
-        # Clean up temporary file
-        if os.path.exists(temp_file_path):
-            os.unlink(temp_file_path)
+    return IngestionJobsListResponse(jobs=jobs)
+
+
+@router.get("/jobs/{job_id}", response_model=IngestionJobResponse)
+def get_job(
+    job_id: str,
+    user_id: str = Depends(get_current_user_id)
+):
+    """Get processing status, queue position and ETA for an upload"""
+    job = ingestion_scheduler.get_job(job_id)
+    
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    
+    if job.user_id != user_id:
+        raise HTTPException(status_code=403, detail="Access denied")
+    
+    return IngestionJobResponse(job=job)
 
 
 @router.get("/{comic_id}", response_model=ComicResponse)
 async def get_comic(
     comic_id: str,
+    request: Request,
+    response: Response,
     user_id: str = Depends(get_current_user_id)
 ):
     """Get a specific comic"""
+    # The body depends on the Accept header, so caches must key on it
+    response.headers["Vary"] = "Accept"
+    
     comic = comic_service.get_comic(comic_id)
     
     if not comic:
@@ -64,14 +118,23 @@ async def get_comic(
     if comic.user_id != user_id:
         raise HTTPException(status_code=403, detail="Access denied")
     
+    if wants_msgpack(request):
+        return msgpack_response({"comic": encode_comic(comic)})
+    
     return ComicResponse(comic=comic)
 
 
 @router.get("/", response_model=ComicsListResponse)
 async def get_user_comics(
+    request: Request,
+    response: Response,
     user_id: str = Depends(get_current_user_id)
 ):
     """Get all comics for the current user"""
+    response.headers["Vary"] = "Accept"
     comics = comic_service.get_user_comics(user_id)
     
+    if wants_msgpack(request):
+        return msgpack_response({"comics": [encode_comic(comic) for comic in comics]})
+    
     return ComicsListResponse(comics=comics)
\ No newline at end of file
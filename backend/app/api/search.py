@@ -0,0 +1,105 @@
+from typing import Optional
+from fastapi import APIRouter, HTTPException, Depends, Query
+from fastapi.security import HTTPBearer
+from app.services.comic_service import comic_service
+from app.services.search_service import search_service
+from app.schemas.search import SearchResponse, PageJumpResponse, ReindexResponse, BulkReindexResponse
+
+router = APIRouter(prefix="/search", tags=["search"])
+security = HTTPBearer()
+
+
+def get_current_user_id(token: str = Depends(security)) -> str:
+    # For MVP, we'll use a simple user ID
+    # In production, validate JWT token here
+    return "00000000-0000-0000-0000-000000000001"
+
+
+@router.get("/", response_model=SearchResponse)
+async def search_dialogue(
+    q: Optional[str] = None,
+    character: Optional[str] = None,
+    comic_id: Optional[str] = None,
+    phrase: bool = False,
+    limit: int = Query(20, ge=1, le=100),
+    user_id: str = Depends(get_current_user_id)
+):
+    """Find bubbles by text, speaker, or both (e.g. where character X says Y)"""
+    
+    if not q and not character:
+        raise HTTPException(status_code=400, detail="Provide a query, a character, or both")
+    
+    results = search_service.search(
+        user_id=user_id,
+        query=q,
+        character=character,
+        comic_id=comic_id,
+        phrase=phrase,
+        limit=limit
+    )
+    
+    return SearchResponse(query=q or "", character=character, results=results)
+
+
+@router.get("/comics/{comic_id}/page", response_model=PageJumpResponse)
+async def find_page(
+    comic_id: str,
+    q: str,
+    user_id: str = Depends(get_current_user_id)
+):
+    """Find the first page of a comic containing a phrase"""
+    match = search_service.find_page(user_id, comic_id, q)
+    
+    if not match:
+        raise HTTPException(status_code=404, detail="Phrase not found in comic")
+    
+    return PageJumpResponse(
+        comic_id=comic_id,
+        query=q,
+        page_number=match.page_number,
+        match=match
+    )
+
+
+@router.post("/comics/{comic_id}/reindex", response_model=ReindexResponse)
+async def reindex_comic(
+    comic_id: str,
+    user_id: str = Depends(get_current_user_id)
+):
+    """Rebuild the search index for a single comic"""
+    comic = comic_service.get_comic(comic_id)
+    
+    if not comic:
+        raise HTTPException(status_code=404, detail="Comic not found")
+    
+    if comic.user_id != user_id:
+        raise HTTPException(status_code=403, detail="Access denied")
+    
+    try:
+        indexed = search_service.index_comic(comic)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to index comic: {str(e)}")
+    
+    return ReindexResponse(
+        comic_id=comic_id,
+        indexed=indexed,
+        message="Comic indexed successfully"
+    )
+
+
+# Plain def: this makes one database round trip per comic, so it runs in the
+# threadpool rather than holding the event loop
+@router.post("/reindex", response_model=BulkReindexResponse)
+def reindex_library(
+    user_id: str = Depends(get_current_user_id)
+):
+    """Rebuild the search index for all of the current user's comics"""
+    comics = comic_service.get_user_comics(user_id)
+    indexed, failed = search_service.index_comics(comics)
+    
+    return BulkReindexResponse(
+        comics=len(comics) - len(failed),
+        indexed=indexed,
+        failed=failed,
+        message="Library indexed" if not failed else f"Failed to index {len(failed)} comics"
+    )
@@ -0,0 +1,188 @@
+import msgpack
+from typing import Dict, Any, List, Tuple
+from app.models.comic import Comic, ComicMetadata
+
+# Version marker for the compact layout; legacy rows carry no marker
+COMPACT_FORMAT = 2
+
+MSGPACK_MEDIA_TYPE = "application/x-msgpack"
+
+
+class _Interner:
+    """Assign small integer ids to repeated strings in first-seen order"""
+
+    def __init__(self, initial: List[str] = None):
+        self.values: List[str] = []
+        self._ids: Dict[str, int] = {}
+        for value in initial or []:
+            self.intern(value)
+
+    def intern(self, value: str) -> int:
+        if value not in self._ids:
+            self._ids[value] = len(self.values)
+            self.values.append(value)
+        return self._ids[value]
+
+
+def encode_metadata(metadata: ComicMetadata) -> Dict[str, Any]:
+    """Convert metadata to the compact columnar layout used for storage.
+
+    Speaker names and bubble types are interned into shared tables, and each
+    page is stored as a list of parallel columns:
+
+        [page_number, panel_ids, panel_orders, bubble_counts,
+         bubble_ids, texts, bubble_orders, speaker_ids, type_ids]
+
+    where the bubble columns cover every panel on the page in order and
+    bubble_counts says how many belong to each panel.
+    """
+    characters = _Interner()
+    # Declared names are interned first; the list keeps duplicates and order
+    declared = [characters.intern(name) for name in metadata.characters]
+    bubble_types = _Interner()
+
+    pages = []
+    for page in metadata.pages:
+        panel_ids, panel_orders, bubble_counts = [], [], []
+        bubble_ids, texts, bubble_orders, speaker_ids, type_ids = [], [], [], [], []
+
+        for panel in page.panels:
+            panel_ids.append(panel.panel_id)
+            panel_orders.append(panel.order)
+            bubble_counts.append(len(panel.bubbles))
+
+            for bubble in panel.bubbles:
+                bubble_ids.append(bubble.bubble_id)
+                texts.append(bubble.text)
+                bubble_orders.append(bubble.order)
+                speaker_ids.append(characters.intern(bubble.character))
+                type_ids.append(bubble_types.intern(bubble.bubble_type))
+
+        pages.append([
+            page.page_number, panel_ids, panel_orders, bubble_counts,
+            bubble_ids, texts, bubble_orders, speaker_ids, type_ids
+        ])
+
+    return {
+        "format": COMPACT_FORMAT,
+        "title": metadata.title,
+        "reading_direction": metadata.reading_direction,
+        "style": metadata.style,
+        # Ids of metadata.characters; speakers who were never declared are
+        # interned too but only appear in the bubble columns
+        "declared_characters": declared,
+        "characters": characters.values,
+        "bubble_types": bubble_types.values,
+        "pages": pages
+    }
+
+
+def decode_metadata(data: Dict[str, Any]) -> ComicMetadata:
+    """Build ComicMetadata from a stored row in either the compact or legacy layout"""
+
+    if data.get("format") != COMPACT_FORMAT:
+        return ComicMetadata(**data)
+
+    characters = data["characters"]
+    bubble_types = data["bubble_types"]
+    declared = data["declared_characters"]
+    if isinstance(declared, int):
+        # Earlier compact rows stored only how many leading entries were declared
+        declared = range(declared)
+
+    pages = []
+    for (page_number, panel_ids, panel_orders, bubble_counts,
+         bubble_ids, texts, bubble_orders, speaker_ids, type_ids) in data["pages"]:
+        panels = []
+        start = 0
+
+        for panel_id, panel_order, count in zip(panel_ids, panel_orders, bubble_counts):
+            end = start + count
+            bubbles = [
+                {
+                    "bubble_id": bubble_ids[i],
+                    "text": texts[i],
+                    "order": bubble_orders[i],
+                    "character": characters[speaker_ids[i]],
+                    "bubble_type": bubble_types[type_ids[i]]
+                }
+                for i in range(start, end)
+            ]
+            panels.append({"panel_id": panel_id, "order": panel_order, "bubbles": bubbles})
+            start = end
+
+        pages.append({"page_number": page_number, "panels": panels})
+
+    # A single validation pass over plain dicts is cheaper than building each
+    # nested model separately
+    return ComicMetadata.model_validate({
+        "title": data["title"],
+        "characters": [characters[i] for i in declared],
+        "reading_direction": data["reading_direction"],
+        "style": data["style"],
+        "pages": pages
+    })
+
+
+def encode_comic(comic: Comic) -> Dict[str, Any]:
+    """Dump a comic for binary transport, with metadata in the compact layout"""
+    comic_data = comic.model_dump(mode="json", exclude={"metadata"})
+    comic_data["metadata"] = encode_metadata(comic.metadata) if comic.metadata else None
+    return comic_data
+
+
+def pack(payload: Dict[str, Any]) -> bytes:
+    """Serialize a JSON-compatible payload as msgpack"""
+    return msgpack.packb(payload, use_bin_type=True)
+
+
+def unpack(data: bytes) -> Dict[str, Any]:
+    """Deserialize a msgpack payload produced by pack()"""
+    return msgpack.unpackb(data, raw=False)
+
+
+def _accept_quality(accept: str, media_type: str) -> Tuple[float, bool]:
+    """q-value an Accept header gives a media type, and whether it was named explicitly.
+
+    The most specific matching range wins: type/subtype, then type/*, then */*.
+    """
+    main_type = media_type.split("/")[0]
+    best_specificity, quality = -1, 0.0
+
+    for media_range in accept.split(","):
+        name, *params = media_range.split(";")
+        name = name.strip().lower()
+
+        if name == media_type:
+            specificity = 2
+        elif name == f"{main_type}/*":
+            specificity = 1
+        elif name == "*/*":
+            specificity = 0
+        else:
+            continue
+
+        range_quality = 1.0
+        for param in params:
+            key, _, value = param.partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    range_quality = float(value)
+                except ValueError:
+                    range_quality = 0.0
+
+        if specificity > best_specificity:
+            best_specificity, quality = specificity, range_quality
+
+    return quality, best_specificity == 2
+
+
+def accepts_msgpack(accept: str) -> bool:
+    """Check whether an Accept header prefers msgpack over JSON.
+
+    msgpack must be named explicitly with a non-zero q-value no lower than
+    JSON's; wildcards alone keep the JSON default.
+    """
+    msgpack_quality, named = _accept_quality(accept, MSGPACK_MEDIA_TYPE)
+    json_quality, _ = _accept_quality(accept, "application/json")
+    return named and msgpack_quality > 0 and msgpack_quality >= json_quality
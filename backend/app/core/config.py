@@ -9,6 +9,18 @@ class Settings(BaseSettings):
     openai_api_key: str
     environment: str = "development"
     
+    # Ingestion scheduling
+    ingestion_workers: int = 4
+    ingestion_user_concurrency: int = 2  # pages in flight per user
+    ingestion_user_token_budget: int = 1_000_000  # OpenAI tokens per budget window
+    ingestion_budget_window_seconds: int = 86400
+    ingestion_tokens_per_page: int = 3000  # reserved per page until actual usage is known
+    ingestion_style_tokens: int = 1500  # reserved per comic for the style-detection call
+    ingestion_interactive_weight: float = 4.0  # share relative to the bulk lane
+    ingestion_interactive_max_pages: int = 60  # larger uploads always go to the bulk lane
+    ingestion_page_seconds_estimate: float = 8.0  # initial ETA estimate before real timings
+    ingestion_job_retention_seconds: int = 3600
+    
     class Config:
         env_file = ".env"
 
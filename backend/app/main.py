@@ -1,7 +1,9 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from app.api.comics import router as comics_router
 from app.api.sessions import router as sessions_router
+from app.api.search import router as search_router
 
 app = FastAPI(
     title="Bubbl API",
@@ -18,9 +20,13 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress larger responses (comic metadata) for clients that accept gzip
+app.add_middleware(GZipMiddleware, minimum_size=1000)
+
 # Include routers
 app.include_router(comics_router, prefix="/api")
 app.include_router(sessions_router, prefix="/api")
+app.include_router(search_router, prefix="/api")
 
 
 @app.get("/")
@@ -1,12 +1,44 @@
-from typing import Optional, Dict, Any, List
+from typing import Optional, Any, List
 from datetime import datetime
-from pydantic import BaseModel
+from pydantic import BaseModel, ValidationInfo, field_validator
+
+
+class ComicBubble(BaseModel):
+    bubble_id: str
+    text: str = ""
+    order: int = 1
+    character: str = "unknown"
+    bubble_type: str = "speech"  # "speech", "thought", "narration" or "sound"
+    
+    @field_validator("text", "order", "character", "bubble_type", mode="before")
+    @classmethod
+    def null_to_default(cls, value: Any, info: ValidationInfo) -> Any:
+        # AI output and legacy rows use null for unknown values
+        return cls.model_fields[info.field_name].default if value is None else value
 
 
 class ComicPanel(BaseModel):
     panel_id: str
     order: int
-    bubbles: List[Dict[str, Any]]
+    bubbles: List[ComicBubble]
+    
+    @field_validator("bubbles", mode="before")
+    @classmethod
+    def fill_bubble_ids(cls, bubbles: Any, info: ValidationInfo) -> Any:
+        """Number bubbles that arrive without an id or order, e.g. p3_2 -> b3_2_1"""
+        if not isinstance(bubbles, list):
+            return bubbles
+        
+        panel_id = info.data.get("panel_id", "")
+        prefix = f"b{panel_id[1:]}" if panel_id.startswith("p") else f"{panel_id}_b"
+        
+        filled = []
+        for position, bubble in enumerate(bubbles, 1):
+            if isinstance(bubble, dict) and not bubble.get("bubble_id"):
+                order = bubble.get("order") or position
+                bubble = {**bubble, "order": order, "bubble_id": f"{prefix}_{order}"}
+            filled.append(bubble)
+        return filled
 
 
 class ComicPage(BaseModel):
@@ -0,0 +1,18 @@
+from typing import Optional
+from datetime import datetime
+from pydantic import BaseModel
+
+
+class IngestionJob(BaseModel):
+    id: str
+    user_id: str
+    title: str
+    lane: str  # "interactive" or "bulk"
+    status: str = "queued"  # "queued", "processing", "completed" or "failed"
+    total_pages: int
+    completed_pages: int = 0
+    queue_position: Optional[int] = None  # pages scheduled ahead of this job's next page
+    eta_seconds: Optional[float] = None
+    comic_id: Optional[str] = None
+    error: Optional[str] = None
+    created_at: Optional[datetime] = None
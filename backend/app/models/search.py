@@ -0,0 +1,17 @@
+from typing import Optional
+from pydantic import BaseModel
+
+
+class SearchEntry(BaseModel):
+    id: Optional[str] = None
+    comic_id: str
+    user_id: str
+    page_number: int
+    panel_id: str
+    panel_order: int
+    bubble_id: str
+    bubble_order: int
+    character: str
+    character_key: str
+    bubble_type: str
+    text: str
@@ -7,11 +7,6 @@ class ComicUploadRequest(BaseModel):
     title: str
 
 
-class ComicUploadResponse(BaseModel):
-    comic: Comic
-    message: str
-
-
 class ComicResponse(BaseModel):
     comic: Comic
 
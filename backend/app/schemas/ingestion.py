@@ -0,0 +1,11 @@
+from pydantic import BaseModel
+from app.models.ingestion import IngestionJob
+
+
+class IngestionJobResponse(BaseModel):
+    job: IngestionJob
+    message: str = ""
+
+
+class IngestionJobsListResponse(BaseModel):
+    jobs: list[IngestionJob]
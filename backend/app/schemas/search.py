@@ -0,0 +1,29 @@
+from pydantic import BaseModel
+from typing import Optional
+from app.models.search import SearchEntry
+
+
+class SearchResponse(BaseModel):
+    query: str
+    character: Optional[str] = None
+    results: list[SearchEntry]
+
+
+class PageJumpResponse(BaseModel):
+    comic_id: str
+    query: str
+    page_number: Optional[int] = None
+    match: Optional[SearchEntry] = None
+
+
+class ReindexResponse(BaseModel):
+    comic_id: str
+    indexed: int
+    message: str
+
+
+class BulkReindexResponse(BaseModel):
+    comics: int
+    indexed: int
+    failed: list[str]
+    message: str
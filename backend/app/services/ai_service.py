@@ -3,30 +3,43 @@ import fitz  # PyMuPDF
 from openai import OpenAI
 from typing import List, Dict, Any
 from app.core.config import settings
-from app.models.comic import ComicMetadata, ComicPage, ComicPanel
+from app.models.comic import ComicMetadata, ComicPage, ComicPanel, ComicBubble
 
 
 class AIService:
     def __init__(self):
         self.client = OpenAI(api_key=settings.openai_api_key)
     
-    def process_comic_pdf(self, pdf_path: str, comic_title: str) -> ComicMetadata:
-        """Process PDF comic and extract characters, panels, and dialogue using GPT-4V"""
+    def count_pages(self, pdf_path: str) -> int:
+        """Count the pages in a PDF without rendering them"""
+        try:
+            doc = fitz.open(pdf_path)
+            page_count = doc.page_count
+            doc.close()
+        except Exception as e:
+            # The upload itself is bad, so callers can report it as a client error
+            raise ValueError(f"Error processing PDF: {str(e)}")
         
-        # Extract pages from PDF
-        pages_data = self._extract_pages_from_pdf(pdf_path)
+        return page_count
+    
+    def analyze_page(self, pdf_path: str, comic_title: str, page_num: int) -> Dict[str, Any]:
+        """Render and analyze a single page (1-based) of a PDF comic"""
+        page_image = self._render_page(pdf_path, page_num)
+        return self._analyze_page_with_ai(page_image, comic_title, page_num)
+    
+    def build_metadata(self, pdf_path: str, comic_title: str, page_analyses: List[Dict[str, Any]]) -> ComicMetadata:
+        """Combine per-page analyses into comic metadata"""
         
-        # Process each page with AI
         processed_pages = []
         all_characters = set()
         
-        for page_num, page_image in enumerate(pages_data, 1):
-            page_analysis = self._analyze_page_with_ai(page_image, comic_title, page_num)
+        for page_analysis in page_analyses:
             processed_pages.append(page_analysis["page"])
             all_characters.update(page_analysis["characters"])
         
         # Determine comic style and reading direction
-        style_analysis = self._determine_comic_style(pages_data[0] if pages_data else None, comic_title)
+        first_page = self._render_page(pdf_path, 1) if page_analyses else None
+        style_analysis = self._determine_comic_style(first_page, comic_title)
         
         return ComicMetadata(
             title=comic_title,
@@ -36,27 +49,20 @@ class AIService:
             pages=processed_pages
         )
     
-    def _extract_pages_from_pdf(self, pdf_path: str) -> List[str]:
-        """Extract pages from PDF as base64 encoded images"""
-        pages = []
-        
+    def _render_page(self, pdf_path: str, page_num: int) -> str:
+        """Render a single page (1-based) as a base64 encoded image"""
         try:
             doc = fitz.open(pdf_path)
-            for page_num in range(doc.page_count):
-                page = doc[page_num]
-                # Convert page to image
-                pix = page.get_pixmap(matrix=fitz.Matrix(2, 2))  # 2x scale for better quality
-                img_data = pix.tobytes("png")
-                
-                # Convert to base64
-                img_base64 = base64.b64encode(img_data).decode()
-                pages.append(img_base64)
-            
+            page = doc[page_num - 1]
+            # Convert page to image
+            pix = page.get_pixmap(matrix=fitz.Matrix(2, 2))  # 2x scale for better quality
+            img_data = pix.tobytes("png")
             doc.close()
         except Exception as e:
             raise Exception(f"Error processing PDF: {str(e)}")
         
-        return pages
+        # Convert to base64
+        return base64.b64encode(img_data).decode()
     
     def _analyze_page_with_ai(self, page_image: str, comic_title: str, page_num: int) -> Dict[str, Any]:
         """Analyze a single comic page using GPT-4V"""
@@ -136,9 +142,12 @@ class AIService:
                 panels=panels
             )
             
+            usage = getattr(response, "usage", None)
+            
             return {
                 "page": page,
-                "characters": result.get("characters_on_page", [])
+                "characters": result.get("characters_on_page", []),
+                "tokens": usage.total_tokens if usage else None
             }
             
         except Exception as e:
@@ -150,17 +159,20 @@ class AIService:
                         ComicPanel(
                             panel_id=f"p{page_num}_1",
                             order=1,
-                            bubbles=[{
-                                "bubble_id": f"b{page_num}_1_1",
-                                "text": f"Page {page_num} content (AI processing failed)",
-                                "order": 1,
-                                "character": "Narrator",
-                                "bubble_type": "narration"
-                            }]
+                            bubbles=[
+                                ComicBubble(
+                                    bubble_id=f"b{page_num}_1_1",
+                                    text=f"Page {page_num} content (AI processing failed)",
+                                    order=1,
+                                    character="Narrator",
+                                    bubble_type="narration"
+                                )
+                            ]
                         )
                     ]
                 ),
-                "characters": ["Narrator"]
+                "characters": ["Narrator"],
+                "tokens": None
             }
     
     def _determine_comic_style(self, first_page_image: str, comic_title: str) -> Dict[str, str]:
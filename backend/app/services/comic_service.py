@@ -1,66 +1,114 @@
+import logging
 import os
 import uuid
 from typing import Optional, List
 from app.core.database import db
+from app.core.codec import encode_metadata, decode_metadata
 from app.models.comic import Comic, ComicMetadata
+from app.models.ingestion import IngestionJob
 from app.services.ai_service import ai_service
+from app.services.search_service import search_service
+from app.services.ingestion_scheduler import ingestion_scheduler
+
+logger = logging.getLogger(__name__)
 
 
 class ComicService:
     def __init__(self):
         self.db_client = db.get_client()
     
-    def upload_comic(self, file_path: str, title: str, user_id: str) -> Comic:
-        """Upload and process a new comic"""
+    def submit_comic(self, file_path: str, title: str, user_id: str, lane: str = "interactive") -> IngestionJob:
+        """Queue an uploaded PDF for processing; the scheduler owns the file from here"""
         
         # Generate unique comic ID
         comic_id = str(uuid.uuid4())
+        total_pages = ai_service.count_pages(file_path)
+        
+        def process_page(page_num: int):
+            page_analysis = ai_service.analyze_page(file_path, title, page_num)
+            return page_analysis, page_analysis["tokens"]
+        
+        def finalize(page_analyses: list) -> str:
+            metadata = ai_service.build_metadata(file_path, title, page_analyses)
+            return self._save_comic(file_path, comic_id, title, user_id, metadata).id
+        
+        def cleanup():
+            if os.path.exists(file_path):
+                os.unlink(file_path)
+        
+        return ingestion_scheduler.submit(
+            user_id=user_id,
+            title=title,
+            total_pages=total_pages,
+            process_page=process_page,
+            finalize=finalize,
+            lane=lane,
+            cleanup=cleanup
+        )
+    
+    def _save_comic(self, file_path: str, comic_id: str, title: str, user_id: str, metadata: ComicMetadata) -> Comic:
+        """Store the PDF and processed metadata for a new comic"""
         
         # Upload PDF to Supabase storage
         pdf_url = self._upload_pdf_to_storage(file_path, comic_id)
         
-        # Process comic with AI
-        metadata = ai_service.process_comic_pdf(file_path, title)
-        
         # Save comic to database
         comic_data = {
             "id": comic_id,
             "title": title,
             "user_id": user_id,
             "pdf_url": pdf_url,
-            "metadata": metadata.model_dump()
+            "metadata": encode_metadata(metadata)
         }
         
         result = self.db_client.table("comics").insert(comic_data).execute()
         
-        if result.data:
-            return Comic(**result.data[0])
-        else:
+        if not result.data:
             raise Exception("Failed to save comic to database")
+        
+        comic = self._to_comic(result.data[0])
+        
+        # Index dialogue for search - the comic is already saved, so a failure
+        # here is logged and recoverable through the reindex endpoint
+        try:
+            search_service.index_comic(comic)
+        except Exception:
+            logger.exception("Failed to index comic %s for search", comic.id)
+        
+        return comic
     
     def get_comic(self, comic_id: str) -> Optional[Comic]:
         """Get comic by ID"""
         result = self.db_client.table("comics").select("*").eq("id", comic_id).execute()
         
         if result.data:
-            comic_data = result.data[0]
-            # Parse metadata back to ComicMetadata
-            if comic_data.get("metadata"):
-                comic_data["metadata"] = ComicMetadata(**comic_data["metadata"])
-            return Comic(**comic_data)
+            return self._to_comic(result.data[0])
         return None
     
     def get_user_comics(self, user_id: str) -> List[Comic]:
         """Get all comics for a user"""
         result = self.db_client.table("comics").select("*").eq("user_id", user_id).execute()
         
-        comics = []
-        for comic_data in result.data:
-            if comic_data.get("metadata"):
-                comic_data["metadata"] = ComicMetadata(**comic_data["metadata"])
-            comics.append(Comic(**comic_data))
+        return [self._to_comic(comic_data) for comic_data in result.data]
+    
+    def get_comics_page(self, offset: int, limit: int) -> List[Comic]:
+        """Get one page of all users' comics, oldest first, for maintenance scripts"""
+        result = (
+            self.db_client.table("comics")
+            .select("*")
+            .order("created_at")
+            .order("id")
+            .range(offset, offset + limit - 1)
+            .execute()
+        )
         
-        return comics
+        return [self._to_comic(comic_data) for comic_data in result.data]
+    
+    def _to_comic(self, comic_data: dict) -> Comic:
+        """Build a Comic from a database row, decoding stored metadata"""
+        if comic_data.get("metadata"):
+            comic_data["metadata"] = decode_metadata(comic_data["metadata"])
+        return Comic(**comic_data)
     
     def _upload_pdf_to_storage(self, file_path: str, comic_id: str) -> str:
         """Upload PDF file to Supabase storage"""
@@ -0,0 +1,472 @@
+import math
+import threading
+import time
+import uuid
+from collections import deque
+from datetime import datetime, timezone
+from typing import Optional, Callable, Any, Dict, List, Tuple
+from app.core.config import settings
+from app.models.ingestion import IngestionJob
+
+LANES = ("interactive", "bulk")
+
+# A page processor returns its result plus the tokens it actually used, or
+# None when usage is unknown and the reserved estimate should stand
+PageProcessor = Callable[[int], Tuple[Any, Optional[int]]]
+
+
+class _TokenBucket:
+    """Per-user token budget that refills continuously over the budget window"""
+
+    def __init__(self, capacity: int, window_seconds: int):
+        self.capacity = capacity
+        self.rate = capacity / window_seconds
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self, amount: float) -> float:
+        """Seconds until the bucket holds the given amount, 0 if it already does"""
+        self._refill()
+        return max(0.0, (amount - self.tokens) / self.rate)
+
+    def take(self, amount: float):
+        self._refill()
+        self.tokens -= amount
+
+    def give(self, amount: float):
+        """Return unused tokens; a negative amount charges usage above the estimate"""
+        self._refill()
+        self.tokens = min(self.capacity, self.tokens + amount)
+
+
+class _PageTask:
+    __slots__ = ("job", "page_num", "tokens_reserved")
+
+    def __init__(self, job: "_Job", page_num: int, tokens_reserved: int):
+        self.job = job
+        self.page_num = page_num
+        self.tokens_reserved = tokens_reserved
+
+
+class _Job:
+    def __init__(
+        self,
+        record: IngestionJob,
+        process_page: PageProcessor,
+        finalize: Callable[[List[Any]], str],
+        cleanup: Optional[Callable[[], None]]
+    ):
+        self.record = record
+        self.process_page = process_page
+        self.finalize = finalize
+        self.cleanup = cleanup
+        self.results: Dict[int, Any] = {}
+        self.queued: deque = deque(range(1, record.total_pages + 1))
+        self.in_flight = 0
+        # Tokens held for the style-detection call made by finalize
+        self.style_reserved = 0
+        self.finalizing = False
+        self.finished_at: Optional[float] = None
+
+
+class IngestionScheduler:
+    """Schedule comic ingestion work one page at a time across users.
+
+    Users are served with start-time fair queuing: each user has a virtual
+    clock advanced by 1 / weight per dispatched page, so a user with a
+    500-page import gets the same share of workers as a user with a single
+    chapter. Within a user, interactive jobs go before bulk jobs, and a
+    user's page counts at the interactive weight only while that user has
+    exactly one interactive job active. Per-user concurrency caps and token
+    budgets are checked at dispatch, so a user over budget is throttled
+    rather than refused.
+    """
+
+    def __init__(self):
+        self.workers = settings.ingestion_workers
+        self.user_concurrency = settings.ingestion_user_concurrency
+        self.tokens_per_page = settings.ingestion_tokens_per_page
+        self.style_tokens = settings.ingestion_style_tokens
+        self.interactive_weight = settings.ingestion_interactive_weight
+
+        self._cond = threading.Condition()
+        # Per user, jobs with pages still queued: interactive first, then bulk, FIFO within a lane
+        self._queues: Dict[str, List[_Job]] = {}
+        self._user_finish: Dict[str, float] = {}
+        self._virtual_time = 0.0
+        self._user_in_flight: Dict[str, int] = {}
+        self._active_interactive: Dict[str, int] = {}
+        self._in_flight = 0
+        self._budget_wait: Optional[float] = None
+        self._jobs: Dict[str, _Job] = {}
+        self._buckets: Dict[str, _TokenBucket] = {}
+        self._user_weights: Dict[str, float] = {}
+        self._user_budgets: Dict[str, int] = {}
+        self._page_seconds = settings.ingestion_page_seconds_estimate
+        self._threads: List[threading.Thread] = []
+
+    def set_user_weight(self, user_id: str, weight: float):
+        """Give a user a larger (or smaller) share of ingestion capacity"""
+        with self._cond:
+            self._user_weights[user_id] = weight
+
+    def set_user_budget(self, user_id: str, tokens: int):
+        """Override a user's token budget per window; the bucket starts full"""
+        with self._cond:
+            self._user_budgets[user_id] = tokens
+            self._buckets.pop(user_id, None)
+            self._cond.notify_all()
+
+    def submit(
+        self,
+        user_id: str,
+        title: str,
+        total_pages: int,
+        process_page: PageProcessor,
+        finalize: Callable[[List[Any]], str],
+        lane: str = "interactive",
+        cleanup: Optional[Callable[[], None]] = None
+    ) -> IngestionJob:
+        """Queue a comic for processing and return its job status.
+
+        process_page is called once per page number (1-based) on a worker
+        thread; finalize receives the page results in order and returns the
+        saved comic id. cleanup runs once the job completes or fails.
+        """
+        if lane not in LANES:
+            raise ValueError(f"Unknown lane: {lane}")
+        if total_pages < 1:
+            raise ValueError("Comic has no pages")
+
+        # Only single comics of reasonable size get the interactive lane
+        if total_pages > settings.ingestion_interactive_max_pages:
+            lane = "bulk"
+
+        with self._cond:
+            self._prune_jobs()
+
+            record = IngestionJob(
+                id=str(uuid.uuid4()),
+                user_id=user_id,
+                title=title,
+                lane=lane,
+                total_pages=total_pages,
+                created_at=datetime.now(timezone.utc)
+            )
+            job = _Job(record, process_page, finalize, cleanup)
+            self._jobs[record.id] = job
+            self._enqueue(job)
+
+            self._start_workers()
+            self._cond.notify_all()
+
+            return self._snapshot(job)
+
+    def get_job(self, job_id: str) -> Optional[IngestionJob]:
+        """Current status of a job, including queue position and ETA"""
+        with self._cond:
+            job = self._jobs.get(job_id)
+            return self._snapshot(job) if job else None
+
+    def get_user_jobs(self, user_id: str) -> List[IngestionJob]:
+        """Status of all retained jobs for a user"""
+        with self._cond:
+            return [self._snapshot(job) for job in self._jobs.values() if job.record.user_id == user_id]
+
+    def _bucket(self, user_id: str) -> _TokenBucket:
+        if user_id not in self._buckets:
+            self._buckets[user_id] = _TokenBucket(
+                self._user_budgets.get(user_id, settings.ingestion_user_token_budget),
+                settings.ingestion_budget_window_seconds
+            )
+        return self._buckets[user_id]
+
+    def _enqueue(self, job: _Job):
+        user_id = job.record.user_id
+        jobs = self._queues.setdefault(user_id, [])
+
+        if job.record.lane == "interactive":
+            self._active_interactive[user_id] = self._active_interactive.get(user_id, 0) + 1
+            position = sum(1 for queued in jobs if queued.record.lane == "interactive")
+            jobs.insert(position, job)
+        else:
+            jobs.append(job)
+
+    def _weight(self, user_id: str, job: _Job) -> float:
+        weight = self._user_weights.get(user_id, 1.0)
+        # Several interactive jobs at once look like a bulk import split into
+        # issues, so they only get the boost while there is a single one
+        if job.record.lane == "interactive" and self._active_interactive.get(user_id, 0) == 1:
+            weight *= self.interactive_weight
+        return weight
+
+    def _page_cost(self, job: _Job) -> int:
+        """Tokens to reserve for a job's next page; the first page also holds the style call.
+
+        Capped at the user's bucket capacity, which a larger reservation could
+        never fit, so a small budget slows a job down instead of stalling it.
+        """
+        cost = self.tokens_per_page
+        if len(job.queued) == job.record.total_pages:
+            cost += self.style_tokens
+        return min(cost, self._bucket(job.record.user_id).capacity)
+
+    def _next_task(self) -> Optional[_PageTask]:
+        """Pop the next page from the eligible user with the smallest start tag"""
+        best_user = None
+        best_start = 0.0
+        self._budget_wait = None
+
+        for user_id, jobs in self._queues.items():
+            if self._user_in_flight.get(user_id, 0) >= self.user_concurrency:
+                continue
+
+            wait = self._bucket(user_id).wait_time(self._page_cost(jobs[0]))
+            if wait:
+                self._budget_wait = wait if self._budget_wait is None else min(self._budget_wait, wait)
+                continue
+
+            start = max(self._virtual_time, self._user_finish.get(user_id, 0.0))
+            if best_user is None or start < best_start:
+                best_user, best_start = user_id, start
+
+        if best_user is None:
+            return None
+
+        jobs = self._queues[best_user]
+        job = jobs[0]
+        cost = self._page_cost(job)
+        page_tokens = min(cost, self.tokens_per_page)
+        self._bucket(best_user).take(cost)
+        job.style_reserved += cost - page_tokens
+
+        task = _PageTask(job, job.queued.popleft(), page_tokens)
+        self._user_finish[best_user] = best_start + 1.0 / self._weight(best_user, job)
+        self._virtual_time = best_start
+
+        if not job.queued:
+            jobs.pop(0)
+            if not jobs:
+                del self._queues[best_user]
+
+        return task
+
+    def _dispatch(self) -> Optional[_PageTask]:
+        """Take the next page and mark it in flight"""
+        task = self._next_task()
+        if task is None:
+            return None
+
+        job = task.job
+        user_id = job.record.user_id
+        self._user_in_flight[user_id] = self._user_in_flight.get(user_id, 0) + 1
+        self._in_flight += 1
+        job.in_flight += 1
+        job.record.status = "processing"
+        return task
+
+    def _complete(self, task: _PageTask, result: Any, tokens_used: Optional[int], error: Optional[Exception]) -> bool:
+        """Record a processed page and return whether its job is ready to finalize"""
+        job = task.job
+        user_id = job.record.user_id
+        self._user_in_flight[user_id] -= 1
+        self._in_flight -= 1
+        job.in_flight -= 1
+
+        # Settle actual usage even for pages of a job that has already failed
+        if tokens_used is not None:
+            self._bucket(user_id).give(task.tokens_reserved - tokens_used)
+
+        if error is not None:
+            self._fail(job, error)
+        elif job.record.status != "failed":
+            job.results[task.page_num] = result
+            job.record.completed_pages += 1
+
+        return job.record.status != "failed" and job.record.completed_pages == job.record.total_pages
+
+    def _start_workers(self):
+        if self._threads:
+            return
+        for index in range(self.workers):
+            thread = threading.Thread(target=self._work, name=f"ingestion-{index}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def _work(self):
+        while True:
+            with self._cond:
+                task = self._dispatch()
+                while task is None:
+                    # Wake up when an over-budget user's bucket has refilled
+                    self._cond.wait(self._budget_wait)
+                    task = self._dispatch()
+
+            started = time.monotonic()
+            result, tokens_used, error = None, None, None
+            try:
+                result, tokens_used = task.job.process_page(task.page_num)
+            except Exception as e:
+                error = e
+
+            with self._cond:
+                if error is None:
+                    # Exponentially weighted page time drives the ETA estimates
+                    self._page_seconds = 0.8 * self._page_seconds + 0.2 * (time.monotonic() - started)
+                ready = self._complete(task, result, tokens_used, error)
+                self._cond.notify_all()
+
+            if ready:
+                self._finish(task.job)
+
+    def _finish(self, job: _Job):
+        """Run finalize for a job whose pages are all processed"""
+        with self._cond:
+            job.finalizing = True
+
+        try:
+            comic_id = job.finalize([job.results[page_num] for page_num in sorted(job.results)])
+        except Exception as e:
+            with self._cond:
+                self._fail(job, e)
+            return
+
+        with self._cond:
+            job.record.comic_id = comic_id
+            job.record.status = "completed"
+            self._retire(job)
+        self._cleanup(job)
+
+    def _fail(self, job: _Job, error: Exception):
+        """Mark a job failed, drop its queued pages and release its style reservation"""
+        if job.record.status == "failed":
+            return
+
+        job.record.status = "failed"
+        job.record.error = str(error)
+        self._retire(job)
+
+        user_id = job.record.user_id
+        if job.queued:
+            jobs = self._queues[user_id]
+            jobs.remove(job)
+            if not jobs:
+                del self._queues[user_id]
+            job.queued.clear()
+
+        # The style call only happens in finalize
+        if job.style_reserved and not job.finalizing:
+            self._bucket(user_id).give(job.style_reserved)
+            job.style_reserved = 0
+
+        # Cleanup runs off the lock and only once the last in-flight page is back
+        threading.Thread(target=self._cleanup, args=(job,), daemon=True).start()
+
+    def _retire(self, job: _Job):
+        job.finished_at = time.monotonic()
+        if job.record.lane == "interactive":
+            self._active_interactive[job.record.user_id] -= 1
+
+    def _cleanup(self, job: _Job):
+        with self._cond:
+            while job.in_flight:
+                self._cond.wait()
+            cleanup, job.cleanup = job.cleanup, None
+        if cleanup:
+            try:
+                cleanup()
+            except Exception:
+                pass
+
+    def _position(self, target: _Job) -> Tuple[int, int]:
+        """Pages dispatched, ignoring caps and budgets, before a queued job's
+        first page and before (and including) its last one.
+
+        Every user with queued work gets consecutive start tags from
+        max(virtual time, finish tag), so each user's share of the pages ahead
+        follows from its jobs' page counts and weights without replaying the
+        queue.
+        """
+        user_id = target.record.user_id
+        own_ahead = 0
+        first_tag = max(self._virtual_time, self._user_finish.get(user_id, 0.0))
+        for job in self._queues[user_id]:
+            if job is target:
+                break
+            own_ahead += len(job.queued)
+            first_tag += len(job.queued) / self._weight(user_id, job)
+        last_tag = first_tag + (len(target.queued) - 1) / self._weight(user_id, target)
+
+        ahead = own_ahead
+        through_last = own_ahead + len(target.queued)
+        # _next_task breaks start-tag ties in favour of the user queued first
+        wins_ties = True
+        for other_id, jobs in self._queues.items():
+            if other_id == user_id:
+                wins_ties = False
+                continue
+            ahead += self._pages_before(other_id, jobs, first_tag, wins_ties)
+            through_last += self._pages_before(other_id, jobs, last_tag, wins_ties)
+
+        return ahead, through_last
+
+    def _pages_before(self, user_id: str, jobs: List[_Job], tag: float, inclusive: bool) -> int:
+        """Count a user's queued pages with a start tag below (or at) the given tag"""
+        count = 0
+        start = max(self._virtual_time, self._user_finish.get(user_id, 0.0))
+        for job in jobs:
+            weight = self._weight(user_id, job)
+            span = (tag - start) * weight
+            # Tags are sums of 1 / weight, so allow for float rounding
+            fits = math.floor(span + 1e-9) + 1 if inclusive else math.ceil(span - 1e-9)
+            if fits <= 0:
+                break
+            count += min(len(job.queued), fits)
+            start += len(job.queued) / weight
+        return count
+
+    def _snapshot(self, job: _Job) -> IngestionJob:
+        """Copy a job record with a live queue position and ETA"""
+        record = job.record.model_copy()
+
+        if record.status in ("completed", "failed"):
+            return record
+
+        remaining = len(job.queued) + job.in_flight
+        if not job.queued:
+            record.queue_position = 0
+            record.eta_seconds = round(self._page_seconds if remaining else 0.0, 1)
+            return record
+
+        ahead, through_last = self._position(job)
+
+        # Bounded by total work ahead, this user's concurrency cap, and the
+        # time until the user's budget covers the remaining pages
+        shared = (through_last + self._in_flight) * self._page_seconds / self.workers
+        capped = remaining * self._page_seconds / min(self.user_concurrency, self.workers)
+        first_page_queued = len(job.queued) == job.record.total_pages
+        tokens_needed = len(job.queued) * self.tokens_per_page + (self.style_tokens if first_page_queued else 0)
+        budget = self._bucket(job.record.user_id).wait_time(tokens_needed)
+
+        record.queue_position = ahead
+        record.eta_seconds = round(max(shared, capped, budget), 1)
+        return record
+
+    def _prune_jobs(self):
+        """Forget finished jobs once they are past the retention window"""
+        cutoff = time.monotonic() - settings.ingestion_job_retention_seconds
+        expired = [
+            job_id for job_id, job in self._jobs.items()
+            if job.finished_at is not None and job.finished_at < cutoff
+        ]
+        for job_id in expired:
+            del self._jobs[job_id]
+
+
+# Global ingestion scheduler instance
+ingestion_scheduler = IngestionScheduler()
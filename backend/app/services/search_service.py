@@ -0,0 +1,127 @@
+import logging
+from typing import Optional, List, Dict, Any, Tuple
+from app.core.database import db
+from app.models.comic import Comic
+from app.models.search import SearchEntry
+
+# Columns returned to clients - the generated tsvector column is never selected
+SEARCH_COLUMNS = (
+    "id, comic_id, user_id, page_number, panel_id, panel_order, "
+    "bubble_id, bubble_order, character, character_key, bubble_type, text"
+)
+
+logger = logging.getLogger(__name__)
+
+def normalize_character(character: Optional[str]) -> str:
+    """Normalize a speaker name so lookups ignore case and stray whitespace"""
+    return " ".join((character or "unknown").split()).lower()
+
+
+class SearchService:
+    def __init__(self):
+        self.db_client = db.get_client()
+
+    def index_comic(self, comic: Comic) -> int:
+        """(Re)build the dialogue index rows for a single comic"""
+
+        entries = self._build_entries(comic)
+
+        # The delete and insert run in one transaction inside Postgres, so a
+        # failed or overlapping reindex never leaves a comic half-indexed
+        self.db_client.rpc(
+            "replace_comic_search_entries",
+            {"p_comic_id": comic.id, "p_entries": entries}
+        ).execute()
+
+        return len(entries)
+
+    def index_comics(self, comics: List[Comic]) -> Tuple[int, List[str]]:
+        """Reindex several comics, returning the rows written and the ids that failed.
+
+        A failure is logged and skipped so one bad comic doesn't stop a backfill.
+        """
+        indexed = 0
+        failed = []
+
+        for comic in comics:
+            try:
+                indexed += self.index_comic(comic)
+            except Exception:
+                logger.exception("Failed to index comic %s for search", comic.id)
+                failed.append(comic.id)
+
+        return indexed, failed
+
+    def search(
+        self,
+        user_id: str,
+        query: Optional[str] = None,
+        character: Optional[str] = None,
+        comic_id: Optional[str] = None,
+        phrase: bool = False,
+        limit: int = 20
+    ) -> List[SearchEntry]:
+        """Find bubbles by text and/or speaker across a user's comics"""
+
+        request = self.db_client.table("comic_search_entries").select(SEARCH_COLUMNS).eq("user_id", user_id)
+
+        if comic_id:
+            request = request.eq("comic_id", comic_id)
+
+        if character:
+            request = request.eq("character_key", normalize_character(character))
+
+        if query:
+            # Applied as a plain filter: the client's text_search() returns a
+            # builder without order()/limit()
+            operator = "phfts(english)" if phrase else "wfts(english)"
+            request = request.filter("text_tsv", operator, query)
+
+        result = (
+            request.order("comic_id")
+            .order("page_number")
+            .order("panel_order")
+            .order("bubble_order")
+            .limit(limit)
+            .execute()
+        )
+
+        return [SearchEntry(**entry_data) for entry_data in result.data]
+
+    def find_page(self, user_id: str, comic_id: str, query: str) -> Optional[SearchEntry]:
+        """Return the first bubble in reading order that contains a phrase"""
+        matches = self.search(user_id, query=query, comic_id=comic_id, phrase=True, limit=1)
+        return matches[0] if matches else None
+
+    def _build_entries(self, comic: Comic) -> List[Dict[str, Any]]:
+        """Flatten comic metadata into one index row per bubble"""
+        entries = []
+
+        if not comic.metadata:
+            return entries
+
+        for page in comic.metadata.pages:
+            for panel in page.panels:
+                for bubble in panel.bubbles:
+                    if not bubble.text.strip():
+                        continue
+
+                    entries.append({
+                        "comic_id": comic.id,
+                        "user_id": comic.user_id,
+                        "page_number": page.page_number,
+                        "panel_id": panel.panel_id,
+                        "panel_order": panel.order,
+                        "bubble_id": bubble.bubble_id,
+                        "bubble_order": bubble.order,
+                        "character": bubble.character,
+                        "character_key": normalize_character(bubble.character),
+                        "bubble_type": bubble.bubble_type,
+                        "text": bubble.text
+                    })
+
+        return entries
+
+
+# Global search service instance
+search_service = SearchService()
@@ -0,0 +1 @@
+# Benchmark and load-testing scripts
\ No newline at end of file
@@ -0,0 +1,265 @@
+"""In-process stand-ins for Supabase and OpenAI used by the load tests.
+
+Both fakes block the calling thread for a configurable latency, like the real
+synchronous clients do, and fail a configurable fraction of calls. All
+randomness comes from a seeded generator so runs are repeatable.
+"""
+import json
+import random
+import re
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from typing import Optional, List, Dict, Any
+
+
+@dataclass
+class FaultProfile:
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    error_rate: float = 0.0
+
+
+class _FaultInjector:
+    def __init__(self, profile: FaultProfile, rng: random.Random, name: str):
+        self.profile = profile
+        self.rng = rng
+        self.name = name
+        self._lock = threading.Lock()
+
+    def __call__(self):
+        with self._lock:
+            delay = self.profile.latency_ms + self.rng.uniform(0, self.profile.jitter_ms)
+            failed = self.rng.random() < self.profile.error_rate
+
+        if delay:
+            time.sleep(delay / 1000)
+        if failed:
+            raise Exception(f"{self.name}: injected failure")
+
+
+class FakeQuery:
+    """Subset of the PostgREST query builder used by the services"""
+
+    def __init__(self, table: "FakeTable", action: str, payload: Any = None, columns: str = "*"):
+        self.table = table
+        self.action = action
+        self.payload = payload
+        self.columns = columns
+        self.filters = []
+        self.ordering = []
+        self.row_limit: Optional[int] = None
+        self.row_offset = 0
+
+    def eq(self, column: str, value: Any) -> "FakeQuery":
+        self.filters.append(lambda row: row.get(column) == value)
+        return self
+
+    def filter(self, column: str, operator: str, criteria: str) -> "FakeQuery":
+        if not operator.endswith("fts(english)"):
+            raise NotImplementedError(f"Unsupported filter operator: {operator}")
+
+        needle = criteria.lower()
+        if operator.startswith("ph"):
+            self.filters.append(lambda row: needle in row.get("text", "").lower())
+        else:
+            words = needle.split()
+            self.filters.append(lambda row: all(word in row.get("text", "").lower() for word in words))
+        return self
+
+    def order(self, column: str, desc: bool = False) -> "FakeQuery":
+        self.ordering.append((column, desc))
+        return self
+
+    def limit(self, size: int) -> "FakeQuery":
+        self.row_limit = size
+        return self
+
+    def range(self, start: int, end: int) -> "FakeQuery":
+        self.row_offset = start
+        self.row_limit = end - start + 1
+        return self
+
+    def execute(self) -> SimpleNamespace:
+        self.table.client.faults()
+        with self.table.lock:
+            data = getattr(self, f"_{self.action}")()
+        # Round-trip through JSON so callers get copies, as they would over the wire
+        return SimpleNamespace(data=json.loads(json.dumps(data, default=str)))
+
+    def _matching(self) -> List[Dict[str, Any]]:
+        return [row for row in self.table.rows if all(match(row) for match in self.filters)]
+
+    def _select(self) -> List[Dict[str, Any]]:
+        rows = self._matching()
+        for column, desc in reversed(self.ordering):
+            rows.sort(key=lambda row: row.get(column), reverse=desc)
+        rows = rows[self.row_offset:]
+        if self.row_limit is not None:
+            rows = rows[:self.row_limit]
+        if self.columns.strip() != "*":
+            names = [name.strip() for name in self.columns.split(",")]
+            rows = [{name: row.get(name) for name in names} for row in rows]
+        return rows
+
+    def _insert(self) -> List[Dict[str, Any]]:
+        records = self.payload if isinstance(self.payload, list) else [self.payload]
+        inserted = []
+        for record in records:
+            row = {"id": str(uuid.uuid4()), "created_at": datetime.now(timezone.utc).isoformat()}
+            row.update(json.loads(json.dumps(record)))
+            self.table.rows.append(row)
+            inserted.append(row)
+        return inserted
+
+    def _update(self) -> List[Dict[str, Any]]:
+        rows = self._matching()
+        for row in rows:
+            row.update(json.loads(json.dumps(self.payload)))
+        return rows
+
+    def _delete(self) -> List[Dict[str, Any]]:
+        rows = self._matching()
+        self.table.rows = [row for row in self.table.rows if row not in rows]
+        return rows
+
+
+class FakeTable:
+    def __init__(self, client: "FakeSupabaseClient"):
+        self.client = client
+        self.rows: List[Dict[str, Any]] = []
+        self.lock = threading.Lock()
+
+    def select(self, columns: str = "*") -> FakeQuery:
+        return FakeQuery(self, "select", columns=columns)
+
+    def insert(self, payload: Any) -> FakeQuery:
+        return FakeQuery(self, "insert", payload)
+
+    def update(self, payload: Dict[str, Any]) -> FakeQuery:
+        return FakeQuery(self, "update", payload)
+
+    def delete(self) -> FakeQuery:
+        return FakeQuery(self, "delete")
+
+
+class FakeBucket:
+    def __init__(self, client: "FakeSupabaseClient", name: str):
+        self.client = client
+        self.name = name
+
+    def upload(self, path: str, file_data: bytes) -> None:
+        self.client.faults()
+        self.client.objects[f"{self.name}/{path}"] = len(file_data)
+
+    def get_public_url(self, path: str) -> str:
+        return f"https://storage.bench.local/{self.name}/{path}"
+
+
+class FakeStorage:
+    def __init__(self, client: "FakeSupabaseClient"):
+        self.client = client
+
+    def from_(self, bucket: str) -> FakeBucket:
+        return FakeBucket(self.client, bucket)
+
+
+class FakeSupabaseClient:
+    """Stand-in for supabase.Client backed by in-memory tables"""
+
+    def __init__(self, profile: FaultProfile = None, seed: int = 0):
+        self.faults = _FaultInjector(profile or FaultProfile(), random.Random(seed), "supabase")
+        self.tables: Dict[str, FakeTable] = {}
+        # Stored objects are tracked by size only to keep memory flat
+        self.objects: Dict[str, int] = {}
+        self.storage = FakeStorage(self)
+
+    def table(self, name: str) -> FakeTable:
+        if name not in self.tables:
+            self.tables[name] = FakeTable(self)
+        return self.tables[name]
+
+    def rpc(self, fn: str, params: Dict[str, Any]) -> SimpleNamespace:
+        handler = getattr(self, f"_rpc_{fn}", None)
+        if handler is None:
+            raise NotImplementedError(f"Unsupported function: {fn}")
+        return SimpleNamespace(execute=lambda: self._run_rpc(handler, params))
+
+    def _run_rpc(self, handler, params: Dict[str, Any]) -> SimpleNamespace:
+        self.faults()
+        return SimpleNamespace(data=handler(**json.loads(json.dumps(params))))
+
+    def _rpc_replace_comic_search_entries(self, p_comic_id: str, p_entries: List[Dict[str, Any]]) -> None:
+        table = self.table("comic_search_entries")
+        with table.lock:
+            table.rows = [row for row in table.rows if row["comic_id"] != p_comic_id]
+            for entry in p_entries:
+                table.rows.append({"id": str(uuid.uuid4()), **entry, "comic_id": p_comic_id})
+
+
+class FakeChatCompletions:
+    CHARACTERS = ["Hero", "Sidekick", "Villain", "Narrator"]
+    BUBBLE_TYPES = ["speech", "speech", "thought", "narration", "sound"]
+    WORDS = "look out behind you we have to go now never again friend city night help".split()
+    # Rough cost of a rendered page image as vision input
+    IMAGE_TOKENS = 1100
+
+    def __init__(self, client: "FakeOpenAIClient"):
+        self.client = client
+
+    def create(self, model: str, messages: List[Dict[str, Any]], **kwargs) -> SimpleNamespace:
+        self.client.faults()
+        prompt = messages[0]["content"][0]["text"]
+
+        page_match = re.search(r"\(page (\d+)\)", prompt)
+        if page_match:
+            content = self._page_analysis(int(page_match.group(1)))
+        else:
+            content = {"reading_direction": "ltr", "style": "western"}
+
+        self.client.calls += 1
+        message = SimpleNamespace(content=json.dumps(content))
+        # Report usage like the real API so the scheduler settles actual
+        # tokens instead of keeping its per-page estimate
+        prompt_tokens = self.IMAGE_TOKENS + len(prompt) // 4
+        completion_tokens = len(message.content) // 4
+        usage = SimpleNamespace(
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            total_tokens=prompt_tokens + completion_tokens
+        )
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)], usage=usage)
+
+    def _page_analysis(self, page_num: int) -> Dict[str, Any]:
+        with self.client.lock:
+            rng = self.client.rng
+            panels = []
+            for panel_num in range(1, rng.randint(3, 6) + 1):
+                bubbles = [
+                    {
+                        "bubble_id": f"b{page_num}_{panel_num}_{bubble_num}",
+                        "text": " ".join(rng.choice(self.WORDS) for _ in range(rng.randint(3, 12))),
+                        "order": bubble_num,
+                        "character": rng.choice(self.CHARACTERS),
+                        "bubble_type": rng.choice(self.BUBBLE_TYPES)
+                    }
+                    for bubble_num in range(1, rng.randint(1, 4) + 1)
+                ]
+                panels.append({"panel_id": f"p{page_num}_{panel_num}", "order": panel_num, "bubbles": bubbles})
+
+        characters = sorted({bubble["character"] for panel in panels for bubble in panel["bubbles"]})
+        return {"page_number": page_num, "panels": panels, "characters_on_page": characters}
+
+
+class FakeOpenAIClient:
+    """Stand-in for openai.OpenAI covering chat.completions.create"""
+
+    def __init__(self, profile: FaultProfile = None, seed: int = 0):
+        self.faults = _FaultInjector(profile or FaultProfile(), random.Random(seed), "openai")
+        self.rng = random.Random(seed + 1)
+        self.lock = threading.Lock()
+        self.calls = 0
+        self.chat = SimpleNamespace(completions=FakeChatCompletions(self))
@@ -0,0 +1,63 @@
+"""Synthetic comics for benchmarks: metadata models and renderable PDFs"""
+import random
+import fitz  # PyMuPDF
+from app.models.comic import ComicMetadata, ComicPage, ComicPanel, ComicBubble
+
+WORDS = (
+    "the quick brown fox jumps over lazy dog we need to go now hero villain "
+    "city night power help run look out behind you never again friend"
+).split()
+
+BUBBLE_TYPES = ["speech", "speech", "speech", "thought", "narration", "sound"]
+
+
+def make_metadata(pages: int, panels_per_page: int, bubbles_per_panel: int, seed: int = 7) -> ComicMetadata:
+    """Build a synthetic comic with a realistic mix of speakers and bubble types"""
+    rng = random.Random(seed)
+    characters = [f"Character {i}" for i in range(8)] + ["Narrator"]
+
+    comic_pages = []
+    for page_num in range(1, pages + 1):
+        panels = []
+        for panel_num in range(1, panels_per_page + 1):
+            bubbles = [
+                ComicBubble(
+                    bubble_id=f"b{page_num}_{panel_num}_{bubble_num}",
+                    text=" ".join(rng.choice(WORDS) for _ in range(rng.randint(3, 18))),
+                    order=bubble_num,
+                    character=rng.choice(characters),
+                    bubble_type=rng.choice(BUBBLE_TYPES)
+                )
+                for bubble_num in range(1, bubbles_per_panel + 1)
+            ]
+            panels.append(ComicPanel(panel_id=f"p{page_num}_{panel_num}", order=panel_num, bubbles=bubbles))
+        comic_pages.append(ComicPage(page_number=page_num, panels=panels))
+
+    return ComicMetadata(
+        title="Benchmark Comic",
+        characters=characters,
+        reading_direction="ltr",
+        style="western",
+        pages=comic_pages
+    )
+
+
+def make_comic_pdf(pages: int, panels_per_page: int = 4, seed: int = 7) -> bytes:
+    """Render a comic-like PDF with bordered panels and dialogue text"""
+    rng = random.Random(seed)
+    doc = fitz.open()
+    width, height, margin = 600, 900, 20
+    panel_height = (height - margin * (panels_per_page + 1)) / panels_per_page
+
+    for page_num in range(1, pages + 1):
+        page = doc.new_page(width=width, height=height)
+        for panel_num in range(panels_per_page):
+            top = margin + panel_num * (panel_height + margin)
+            rect = fitz.Rect(margin, top, width - margin, top + panel_height)
+            page.draw_rect(rect, color=(0, 0, 0), width=2)
+            line = " ".join(rng.choice(WORDS) for _ in range(rng.randint(3, 10)))
+            page.insert_text((rect.x0 + 15, rect.y0 + 30), f"{page_num}.{panel_num + 1}: {line}", fontsize=12)
+
+    pdf_bytes = doc.tobytes()
+    doc.close()
+    return pdf_bytes
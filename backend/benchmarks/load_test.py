@@ -0,0 +1,245 @@
+"""Load scenarios for the API, run in-process against Supabase/OpenAI fakes.
+
+Run from the backend directory:
+
+    python -m benchmarks.load_test --scenario all --requests 200 --concurrency 8 \\
+        --db-latency-ms 5 --ai-latency-ms 40 --output baseline.json
+
+    # later, on another commit
+    python -m benchmarks.load_test --scenario all --requests 200 --concurrency 8 \\
+        --db-latency-ms 5 --ai-latency-ms 40 --compare baseline.json
+
+Scenarios:
+    upload    POST synthetic PDFs and wait for their ingestion jobs to finish
+    browse    list the library and open individual comics
+    sessions  concurrent readers creating sessions and paging forward
+
+Peak RSS is the process high-water mark, so it only grows across scenarios;
+run one scenario per invocation to measure it in isolation.
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import resource
+import statistics
+import time
+from typing import Callable, Awaitable, Dict, Any, List
+
+# Settings are read at import time; the fakes never use these values
+for _name in ("SUPABASE_URL", "SUPABASE_ANON_KEY", "SUPABASE_SERVICE_ROLE_KEY", "OPENAI_API_KEY"):
+    os.environ.setdefault(_name, "bench")
+
+import httpx
+from app.core.codec import encode_metadata
+from app.core.database import db
+from benchmarks.fakes import FaultProfile, FakeSupabaseClient, FakeOpenAIClient
+from benchmarks.fixtures import make_metadata, make_comic_pdf
+
+USER_ID = "00000000-0000-0000-0000-000000000001"
+HEADERS = {"Authorization": "Bearer bench"}
+SCENARIOS = ("upload", "browse", "sessions")
+UPLOAD_POLL_SECONDS = 0.05
+# Large enough that no run is throttled by the per-user daily budget
+BENCH_TOKEN_BUDGET = 10 ** 12
+
+Operation = Callable[[httpx.AsyncClient, int, int], Awaitable[httpx.Response]]
+
+
+def install_fakes(args: argparse.Namespace) -> FakeSupabaseClient:
+    """Point the global database and AI clients at the fakes before the app is imported"""
+    supabase = FakeSupabaseClient(
+        FaultProfile(args.db_latency_ms, args.db_jitter_ms, args.db_error_rate),
+        seed=args.seed
+    )
+    # The services grab the client when their module-level instances are built
+    db._client = supabase
+
+    from app.services.ai_service import ai_service
+    ai_service.client = FakeOpenAIClient(
+        FaultProfile(args.ai_latency_ms, args.ai_jitter_ms, args.ai_error_rate),
+        seed=args.seed
+    )
+
+    # Every request runs as one user, so the default budget would run out
+    # partway through a long upload run and stall it until the window refills
+    from app.services.ingestion_scheduler import ingestion_scheduler
+    ingestion_scheduler.set_user_budget(USER_ID, BENCH_TOKEN_BUDGET)
+    return supabase
+
+
+def seed_library(supabase: FakeSupabaseClient, args: argparse.Namespace) -> List[str]:
+    """Insert pre-processed comics directly so browse/session runs skip ingestion"""
+    comic_ids = []
+    for i in range(args.library_size):
+        metadata = make_metadata(args.pages, panels_per_page=5, bubbles_per_panel=3, seed=args.seed + i)
+        comic_id = f"00000000-0000-0000-0000-{i:012d}"
+        supabase.table("comics").rows.append({
+            "id": comic_id,
+            "title": f"Seeded Comic {i}",
+            "user_id": USER_ID,
+            "pdf_url": f"https://storage.bench.local/comics/comics/{comic_id}.pdf",
+            "metadata": encode_metadata(metadata),
+            "created_at": "2024-01-01T00:00:00+00:00"
+        })
+        comic_ids.append(comic_id)
+    return comic_ids
+
+
+def make_operations(args: argparse.Namespace, comic_ids: List[str]) -> Dict[str, Operation]:
+    pdf_bytes = make_comic_pdf(args.pages, seed=args.seed)
+    rng = random.Random(args.seed)
+    browse_targets = [rng.choice(comic_ids) for _ in range(args.requests)]
+    session_ids: Dict[int, str] = {}
+
+    async def upload(client: httpx.AsyncClient, index: int, worker: int) -> httpx.Response:
+        response = await client.post(
+            "/api/comics/upload",
+            params={"title": f"Bench Upload {index}"},
+            files={"file": ("bench.pdf", pdf_bytes, "application/pdf")}
+        )
+        if response.status_code != 202:
+            return response
+
+        # Latency covers the whole ingestion, so follow the job until it settles
+        job_id = response.json()["job"]["id"]
+        while True:
+            await asyncio.sleep(UPLOAD_POLL_SECONDS)
+            response = await client.get(f"/api/comics/jobs/{job_id}")
+            status = response.json()["job"]["status"] if response.status_code == 200 else "failed"
+            if status == "completed":
+                return response
+            if status == "failed":
+                return httpx.Response(500)
+
+    async def browse(client: httpx.AsyncClient, index: int, worker: int) -> httpx.Response:
+        if index % 5 == 0:
+            return await client.get("/api/comics/")
+        return await client.get(f"/api/comics/{browse_targets[index]}")
+
+    async def sessions(client: httpx.AsyncClient, index: int, worker: int) -> httpx.Response:
+        if worker not in session_ids:
+            response = await client.post("/api/sessions/", json={"comic_id": comic_ids[worker % len(comic_ids)]})
+            if response.status_code == 200:
+                session_ids[worker] = response.json()["session"]["id"]
+            return response
+
+        session_id = session_ids[worker]
+        if index % 4 == 0:
+            return await client.get(f"/api/sessions/{session_id}")
+        return await client.put(
+            f"/api/sessions/{session_id}/progress",
+            json={"current_page": index % args.pages + 1, "current_panel": 1}
+        )
+
+    return {"upload": upload, "browse": browse, "sessions": sessions}
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile"""
+    ordered = sorted(samples)
+    rank = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+    return ordered[rank]
+
+
+async def run_scenario(app, operation: Operation, total: int, concurrency: int) -> Dict[str, Any]:
+    transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+    latencies: List[float] = []
+    errors = 0
+    queue: asyncio.Queue = asyncio.Queue()
+    for index in range(total):
+        queue.put_nowait(index)
+
+    async def worker(worker_id: int, client: httpx.AsyncClient):
+        nonlocal errors
+        while not queue.empty():
+            index = queue.get_nowait()
+            start = time.perf_counter()
+            response = await operation(client, index, worker_id)
+            latencies.append((time.perf_counter() - start) * 1000)
+            if response.status_code >= 400:
+                errors += 1
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", headers=HEADERS) as client:
+        start = time.perf_counter()
+        await asyncio.gather(*(worker(worker_id, client) for worker_id in range(concurrency)))
+        elapsed = time.perf_counter() - start
+
+    return {
+        "requests": total,
+        "errors": errors,
+        "elapsed_s": round(elapsed, 3),
+        "throughput_rps": round(total / elapsed, 2),
+        "p50_ms": round(percentile(latencies, 50), 2),
+        "p95_ms": round(percentile(latencies, 95), 2),
+        "p99_ms": round(percentile(latencies, 99), 2),
+        "mean_ms": round(statistics.fmean(latencies), 2),
+        # ru_maxrss is reported in KiB on Linux
+        "peak_rss_mib": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1)
+    }
+
+
+def print_results(results: Dict[str, Dict[str, Any]], baseline: Dict[str, Dict[str, Any]] = None):
+    columns = ("throughput_rps", "p50_ms", "p95_ms", "p99_ms", "errors", "peak_rss_mib")
+    print(f"{'scenario':<10}" + "".join(f"{column:>16}" for column in columns))
+    for scenario, result in results.items():
+        print(f"{scenario:<10}" + "".join(f"{result[column]:>16}" for column in columns))
+        if baseline and scenario in baseline:
+            deltas = []
+            for column in columns:
+                before = baseline[scenario][column]
+                if before:
+                    deltas.append(f"{(result[column] - before) / before * 100:+.1f}%")
+                else:
+                    deltas.append(f"{result[column] - before:+}")
+            print(f"{'  vs base':<10}" + "".join(f"{delta:>16}" for delta in deltas))
+
+
+def parse_args(argv: List[str] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scenario", choices=SCENARIOS + ("all",), default="all")
+    parser.add_argument("--requests", type=int, default=100, help="requests per scenario")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--pages", type=int, default=8, help="pages per synthetic comic")
+    parser.add_argument("--library-size", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--db-latency-ms", type=float, default=5.0)
+    parser.add_argument("--db-jitter-ms", type=float, default=0.0)
+    parser.add_argument("--db-error-rate", type=float, default=0.0)
+    parser.add_argument("--ai-latency-ms", type=float, default=40.0)
+    parser.add_argument("--ai-jitter-ms", type=float, default=0.0)
+    parser.add_argument("--ai-error-rate", type=float, default=0.0)
+    parser.add_argument("--output", help="write results as JSON")
+    parser.add_argument("--compare", help="baseline JSON from a previous --output run")
+    return parser.parse_args(argv)
+
+
+def main():
+    args = parse_args()
+
+    supabase = install_fakes(args)
+    from app.main import app
+
+    comic_ids = seed_library(supabase, args)
+    operations = make_operations(args, comic_ids)
+    scenarios = SCENARIOS if args.scenario == "all" else (args.scenario,)
+
+    results = {}
+    for scenario in scenarios:
+        results[scenario] = asyncio.run(run_scenario(app, operations[scenario], args.requests, args.concurrency))
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)["results"]
+
+    print_results(results, baseline)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"config": vars(args), "results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
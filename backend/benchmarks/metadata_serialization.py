@@ -0,0 +1,73 @@
+"""Compare ComicMetadata storage/transport encodings.
+
+Run from the backend directory:
+
+    python -m benchmarks.metadata_serialization --pages 40 --repeat 50
+
+Reports payload size (raw and gzipped), parse time and peak parse memory per
+comic for the legacy nested JSON path, the compact columnar JSON stored in
+the database, and the msgpack response format.
+"""
+import argparse
+import gzip
+import json
+import statistics
+import time
+import tracemalloc
+from typing import Callable, Any
+from app.core.codec import encode_metadata, decode_metadata, pack, unpack
+from app.models.comic import ComicMetadata
+from benchmarks.fixtures import make_metadata
+
+def time_parse(parse: Callable[[], Any], repeat: int) -> float:
+    """Median wall time of a parse call in milliseconds"""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        parse()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def peak_memory(parse: Callable[[], Any]) -> int:
+    """Peak bytes allocated while parsing a single payload"""
+    tracemalloc.start()
+    result = parse()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=int, default=40)
+    parser.add_argument("--panels", type=int, default=6)
+    parser.add_argument("--bubbles", type=int, default=3)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    metadata = make_metadata(args.pages, args.panels, args.bubbles)
+
+    legacy_json = json.dumps(metadata.model_dump()).encode()
+    compact_json = json.dumps(encode_metadata(metadata), separators=(",", ":")).encode()
+    compact_msgpack = pack(encode_metadata(metadata))
+
+    formats = [
+        ("legacy json", legacy_json, lambda: ComicMetadata(**json.loads(legacy_json))),
+        ("compact json", compact_json, lambda: decode_metadata(json.loads(compact_json))),
+        ("msgpack", compact_msgpack, lambda: decode_metadata(unpack(compact_msgpack))),
+    ]
+
+    print(f"{args.pages} pages x {args.panels} panels x {args.bubbles} bubbles, median of {args.repeat} runs")
+    print(f"{'format':<14}{'bytes':>10}{'gzip':>10}{'parse ms':>11}{'peak KiB':>11}")
+    for name, payload, parse in formats:
+        assert parse() == metadata, f"{name} did not round-trip"
+        print(
+            f"{name:<14}{len(payload):>10}{len(gzip.compress(payload)):>10}"
+            f"{time_parse(parse, args.repeat):>11.2f}{peak_memory(parse) / 1024:>11.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""Build dialogue search rows for comics uploaded before the search index existed.
+
+New uploads are indexed at ingestion time; run this once after creating
+comic_search_entries from setup_database.sql. Run from the backend directory:
+
+    python -m scripts.backfill_search_index --batch-size 100
+
+Reindexing replaces a comic's rows atomically, so the script is safe to rerun
+and to run while the API is serving uploads.
+"""
+import argparse
+import logging
+from app.services.comic_service import comic_service
+from app.services.search_service import search_service
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--batch-size", type=int, default=100, help="comics loaded per query")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+
+    offset = 0
+    total_comics = total_rows = 0
+    failed = []
+
+    while True:
+        comics = comic_service.get_comics_page(offset, args.batch_size)
+        if not comics:
+            break
+
+        indexed, batch_failed = search_service.index_comics(comics)
+        total_comics += len(comics) - len(batch_failed)
+        total_rows += indexed
+        failed.extend(batch_failed)
+        offset += len(comics)
+        print(f"indexed {total_comics} comics ({total_rows} rows) so far")
+
+    print(f"done: {total_comics} comics, {total_rows} rows, {len(failed)} failed")
+    for comic_id in failed:
+        print(f"  failed: {comic_id}")
+
+
+if __name__ == "__main__":
+    main()
@@ -54,4 +54,63 @@ CREATE POLICY "Users can manage own sessions" ON sessions
 -- Insert a test user for MVP (since we're not implementing full auth yet)
 INSERT INTO users (id, name, email) 
 VALUES ('00000000-0000-0000-0000-000000000001', 'Test User', 'test@bubbl.app')
-ON CONFLICT (id) DO NOTHING;
\ No newline at end of file
+ON CONFLICT (id) DO NOTHING;
+
+-- Dialogue search index: one row per bubble, written at ingestion time.
+-- Comics uploaded before this table existed have no rows; after creating it,
+-- backfill them once from the backend directory with
+--     python -m scripts.backfill_search_index
+-- or per user through POST /api/search/reindex
+CREATE TABLE IF NOT EXISTS comic_search_entries (
+    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    comic_id UUID REFERENCES comics(id) ON DELETE CASCADE,
+    user_id UUID REFERENCES users(id) ON DELETE CASCADE,
+    page_number INTEGER NOT NULL,
+    panel_id TEXT NOT NULL,
+    panel_order INTEGER NOT NULL,
+    bubble_id TEXT NOT NULL,
+    bubble_order INTEGER NOT NULL,
+    character TEXT NOT NULL,
+    character_key TEXT NOT NULL,
+    bubble_type TEXT NOT NULL,
+    text TEXT NOT NULL,
+    text_tsv TSVECTOR GENERATED ALWAYS AS (to_tsvector('english', text)) STORED
+);
+
+CREATE INDEX IF NOT EXISTS comic_search_entries_text_tsv_idx
+    ON comic_search_entries USING GIN (text_tsv);
+CREATE INDEX IF NOT EXISTS comic_search_entries_user_character_idx
+    ON comic_search_entries (user_id, character_key);
+CREATE INDEX IF NOT EXISTS comic_search_entries_comic_order_idx
+    ON comic_search_entries (comic_id, page_number, panel_order, bubble_order);
+
+ALTER TABLE comic_search_entries ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY "Users can search own comics" ON comic_search_entries
+    FOR ALL USING (auth.uid()::text = user_id::text);
+
+-- Replace a comic's index rows atomically; the advisory lock serializes
+-- overlapping reindexes of the same comic
+CREATE OR REPLACE FUNCTION replace_comic_search_entries(p_comic_id UUID, p_entries JSONB)
+RETURNS VOID
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    PERFORM pg_advisory_xact_lock(hashtext(p_comic_id::text));
+
+    DELETE FROM comic_search_entries WHERE comic_id = p_comic_id;
+
+    INSERT INTO comic_search_entries (
+        comic_id, user_id, page_number, panel_id, panel_order,
+        bubble_id, bubble_order, character, character_key, bubble_type, text
+    )
+    SELECT
+        p_comic_id, user_id, page_number, panel_id, panel_order,
+        bubble_id, bubble_order, character, character_key, bubble_type, text
+    FROM jsonb_to_recordset(p_entries) AS entry(
+        user_id UUID, page_number INTEGER, panel_id TEXT, panel_order INTEGER,
+        bubble_id TEXT, bubble_order INTEGER, character TEXT, character_key TEXT,
+        bubble_type TEXT, text TEXT
+    );
+END;
+$$;
@@ -0,0 +1,5 @@
+import os
+
+# Settings are read at import time; the scheduler tests never touch these services
+for name in ("SUPABASE_URL", "SUPABASE_ANON_KEY", "SUPABASE_SERVICE_ROLE_KEY", "OPENAI_API_KEY"):
+    os.environ.setdefault(name, "test")
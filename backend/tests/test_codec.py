@@ -0,0 +1,124 @@
+import pytest
+from app.core.codec import COMPACT_FORMAT, accepts_msgpack, encode_metadata, decode_metadata, encode_comic, pack, unpack
+from app.models.comic import Comic, ComicMetadata, ComicPage, ComicPanel, ComicBubble
+
+
+def make_metadata(characters, speakers):
+    bubbles = [
+        ComicBubble(bubble_id=f"b1_1_{order}", text=f"line {order}", order=order, character=speaker)
+        for order, speaker in enumerate(speakers, 1)
+    ]
+    return ComicMetadata(
+        title="Test Comic",
+        characters=characters,
+        reading_direction="rtl",
+        style="manga",
+        pages=[ComicPage(page_number=1, panels=[ComicPanel(panel_id="p1_1", order=1, bubbles=bubbles)])]
+    )
+
+
+def test_compact_round_trip():
+    metadata = make_metadata(["Hero", "Villain"], ["Hero", "Villain", "Hero"])
+
+    encoded = encode_metadata(metadata)
+
+    assert encoded["format"] == COMPACT_FORMAT
+    assert encoded["characters"] == ["Hero", "Villain"]
+    assert decode_metadata(encoded) == metadata
+
+
+def test_round_trip_keeps_declared_characters_apart_from_speakers():
+    metadata = make_metadata(["A", "A"], ["B", "A"])
+
+    decoded = decode_metadata(encode_metadata(metadata))
+
+    assert decoded.characters == ["A", "A"]
+    assert decoded == metadata
+
+
+def test_round_trip_through_msgpack():
+    comic = Comic(id="c1", title="Test Comic", user_id="u1", metadata=make_metadata(["Hero"], ["Hero", "Narrator"]))
+
+    payload = unpack(pack(encode_comic(comic)))
+
+    assert decode_metadata(payload["metadata"]) == comic.metadata
+
+
+def test_decodes_earlier_compact_rows_with_a_declared_count():
+    metadata = make_metadata(["Hero", "Villain"], ["Narrator", "Hero"])
+    encoded = encode_metadata(metadata)
+    encoded["declared_characters"] = 2
+    encoded["characters"] = ["Hero", "Villain", "Narrator"]
+    encoded["pages"][0][7] = [2, 0]
+
+    assert decode_metadata(encoded) == metadata
+
+
+def test_decodes_legacy_rows():
+    metadata = make_metadata(["Hero"], ["Hero", "Hero"])
+
+    assert decode_metadata(metadata.model_dump()) == metadata
+
+
+def test_legacy_rows_with_null_fields_use_defaults():
+    row = {
+        "title": "Old Comic",
+        "characters": ["Hero"],
+        "pages": [{
+            "page_number": 1,
+            "panels": [{
+                "panel_id": "p1_1",
+                "order": 1,
+                "bubbles": [{
+                    "bubble_id": "b1_1_1",
+                    "text": None,
+                    "order": None,
+                    "character": None,
+                    "bubble_type": None
+                }]
+            }]
+        }]
+    }
+
+    bubble = decode_metadata(row).pages[0].panels[0].bubbles[0]
+
+    assert (bubble.text, bubble.order, bubble.character, bubble.bubble_type) == ("", 1, "unknown", "speech")
+
+
+def test_missing_bubble_ids_are_generated_from_the_panel():
+    row = {
+        "title": "Old Comic",
+        "characters": [],
+        "pages": [{
+            "page_number": 3,
+            "panels": [{
+                "panel_id": "p3_2",
+                "order": 2,
+                "bubbles": [{"text": "first"}, {"text": "second", "order": 5, "bubble_id": ""}]
+            }]
+        }]
+    }
+
+    metadata = decode_metadata(row)
+    bubbles = metadata.pages[0].panels[0].bubbles
+
+    assert [bubble.bubble_id for bubble in bubbles] == ["b3_2_1", "b3_2_5"]
+    assert decode_metadata(encode_metadata(metadata)) == metadata
+
+
+@pytest.mark.parametrize("accept, expected", [
+    ("application/x-msgpack", True),
+    ("application/x-msgpack, application/json;q=0.9", True),
+    ("application/json;q=0.5, Application/X-Msgpack;q=0.8", True),
+    ("", False),
+    ("*/*", False),
+    ("application/*", False),
+    ("application/json", False),
+    ("application/x-msgpack;q=0", False),
+    ("application/x-msgpack; q=0.0", False),
+    ("*/*, application/x-msgpack;q=0.1", False),
+    ("application/x-msgpack;q=0.5, application/json", False),
+    ("application/x-msgpack;q=oops", False),
+])
+def test_accepts_msgpack_honours_q_values(accept, expected):
+    assert accepts_msgpack(accept) is expected
@@ -0,0 +1,151 @@
+import random
+import pytest
+from app.core.config import settings
+from app.services.ingestion_scheduler import IngestionScheduler
+
+
+@pytest.fixture
+def scheduler(monkeypatch):
+    # No worker threads: tests drive dispatch and completion directly
+    monkeypatch.setattr(IngestionScheduler, "_start_workers", lambda self: None)
+    # A long window keeps bucket refill negligible during a test
+    monkeypatch.setattr(settings, "ingestion_budget_window_seconds", 10 ** 9)
+    scheduler = IngestionScheduler()
+    scheduler.user_concurrency = 100
+    return scheduler
+
+
+def submit(scheduler, user_id, pages, lane="bulk"):
+    return scheduler.submit(
+        user_id=user_id,
+        title=f"{user_id} comic",
+        total_pages=pages,
+        process_page=lambda page_num: (page_num, None),
+        finalize=lambda results: "comic-id",
+        lane=lane
+    )
+
+
+def dispatch_order(scheduler):
+    order = []
+    task = scheduler._dispatch()
+    while task is not None:
+        order.append((task.job.record.user_id, task.page_num))
+        task = scheduler._dispatch()
+    return order
+
+
+def test_start_tags_alternate_between_users(scheduler):
+    submit(scheduler, "alice", 4)
+    submit(scheduler, "bob", 2)
+
+    assert dispatch_order(scheduler) == [
+        ("alice", 1), ("bob", 1), ("alice", 2), ("bob", 2), ("alice", 3), ("alice", 4)
+    ]
+
+
+def test_single_interactive_job_outranks_bulk_jobs(scheduler):
+    submit(scheduler, "alice", 6)
+    submit(scheduler, "bob", 3, lane="interactive")
+
+    users = [user_id for user_id, _ in dispatch_order(scheduler)]
+    assert users[:5] == ["alice", "bob", "bob", "bob", "alice"]
+
+
+def test_several_interactive_jobs_get_no_boost(scheduler):
+    submit(scheduler, "alice", 4)
+    submit(scheduler, "bob", 2, lane="interactive")
+    submit(scheduler, "bob", 2, lane="interactive")
+
+    users = [user_id for user_id, _ in dispatch_order(scheduler)]
+    assert users[:4] == ["alice", "bob", "alice", "bob"]
+
+
+def test_concurrency_cap_limits_pages_in_flight(scheduler):
+    scheduler.user_concurrency = 1
+    submit(scheduler, "alice", 3)
+    submit(scheduler, "bob", 3)
+
+    first = scheduler._dispatch()
+    second = scheduler._dispatch()
+    assert (first.job.record.user_id, second.job.record.user_id) == ("alice", "bob")
+    assert scheduler._dispatch() is None
+
+    scheduler._complete(first, first.page_num, None, None)
+    assert scheduler._dispatch().job.record.user_id == "alice"
+
+
+def test_exhausted_budget_throttles_instead_of_refusing(scheduler, monkeypatch):
+    monkeypatch.setattr(settings, "ingestion_user_token_budget", 10000)
+    job = submit(scheduler, "alice", 500)
+
+    assert job.status == "queued"
+    assert len(dispatch_order(scheduler)) == 2
+    assert scheduler._budget_wait > 0
+
+
+def test_failure_refunds_style_reservation_and_settles_in_flight_pages(scheduler):
+    record = submit(scheduler, "alice", 3)
+    bucket = scheduler._bucket("alice")
+    start = bucket.tokens
+
+    first = scheduler._dispatch()
+    second = scheduler._dispatch()
+    assert bucket.tokens == pytest.approx(start - 2 * scheduler.tokens_per_page - scheduler.style_tokens, abs=1)
+
+    scheduler._complete(first, None, None, RuntimeError("render failed"))
+    job = scheduler.get_job(record.id)
+    assert job.status == "failed"
+    assert job.error == "render failed"
+    assert scheduler._dispatch() is None
+
+    # The failed page keeps its estimate, the style call never ran, and the
+    # page still in flight is settled against its real usage
+    scheduler._complete(second, second.page_num, 1000, None)
+    assert bucket.tokens == pytest.approx(start - scheduler.tokens_per_page - 1000, abs=1)
+
+
+def test_snapshot_reports_pages_ahead(scheduler):
+    alice = submit(scheduler, "alice", 10)
+    bob = submit(scheduler, "bob", 2)
+
+    assert scheduler.get_job(alice.id).queue_position == 0
+    assert scheduler.get_job(bob.id).queue_position == 1
+
+    scheduler._dispatch()
+    assert scheduler.get_job(bob.id).queue_position == 0
+
+
+def test_snapshot_positions_match_dispatch_order(scheduler):
+    rng = random.Random(3)
+    for index in range(12):
+        submit(scheduler, f"user{index % 4}", rng.randint(1, 9), lane=rng.choice(["interactive", "bulk"]))
+    for _ in range(7):
+        scheduler._dispatch()
+
+    queued = [job for job in scheduler._jobs.values() if job.queued]
+    positions = {job.record.id: scheduler.get_job(job.record.id).queue_position for job in queued}
+
+    first_dispatched = {}
+    task = scheduler._dispatch()
+    index = 0
+    while task is not None:
+        first_dispatched.setdefault(task.job.record.id, index)
+        index += 1
+        task = scheduler._dispatch()
+
+    assert positions == first_dispatched
+
+
+def test_reservation_is_capped_at_a_small_budget(scheduler, monkeypatch):
+    monkeypatch.setattr(settings, "ingestion_user_token_budget", 2000)
+    record = submit(scheduler, "alice", 2)
+
+    first = scheduler._dispatch()
+    assert first.tokens_reserved + first.job.style_reserved == 2000
+    assert scheduler._dispatch() is None
+
+    # Once the bucket is full again the next page fits as well
+    scheduler._bucket("alice").tokens = 2000
+    assert scheduler._dispatch().tokens_reserved == 2000
+    assert scheduler.get_job(record.id).queue_position == 0
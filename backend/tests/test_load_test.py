@@ -0,0 +1,26 @@
+import asyncio
+from app.core.config import settings
+from benchmarks import load_test
+
+
+def test_upload_scenario_runs_to_completion(monkeypatch):
+    # A default budget too small for the whole run: without the benchmark
+    # override the later uploads would wait for the budget window to refill
+    monkeypatch.setattr(settings, "ingestion_user_token_budget", 5000)
+    args = load_test.parse_args([
+        "--scenario", "upload", "--requests", "6", "--concurrency", "3", "--pages", "2",
+        "--library-size", "1", "--db-latency-ms", "0", "--ai-latency-ms", "0"
+    ])
+
+    supabase = load_test.install_fakes(args)
+    from app.main import app
+
+    comic_ids = load_test.seed_library(supabase, args)
+    operations = load_test.make_operations(args, comic_ids)
+    result = asyncio.run(asyncio.wait_for(
+        load_test.run_scenario(app, operations["upload"], args.requests, args.concurrency),
+        timeout=30
+    ))
+
+    assert result["errors"] == 0
+    assert len(supabase.table("comics").rows) == 1 + args.requests
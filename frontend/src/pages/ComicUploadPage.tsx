@@ -2,8 +2,17 @@ import React, { useState } from 'react';
 import { useNavigate, Link } from 'react-router-dom';
 import { motion } from 'framer-motion';
 import { comicApi } from '../services/api';
+import { IngestionJob } from '../services/types';
 import { useComicStore } from '../stores/comic';
 
+const JOB_POLL_INTERVAL_MS = 2000;
+
+const formatEta = (seconds?: number) => {
+  if (seconds === undefined || seconds === null) return 'a moment';
+  if (seconds < 60) return `${Math.max(1, Math.round(seconds))} seconds`;
+  return `${Math.round(seconds / 60)} minutes`;
+};
+
 const ComicUploadPage: React.FC = () => {
   const navigate = useNavigate();
   const { setCurrentComic, setLoading, setError } = useComicStore();
@@ -12,6 +21,7 @@ const ComicUploadPage: React.FC = () => {
   const [title, setTitle] = useState('');
   const [isUploading, setIsUploading] = useState(false);
   const [uploadError, setUploadError] = useState<string | null>(null);
+  const [job, setJob] = useState<IngestionJob | null>(null);
   const [dragOver, setDragOver] = useState(false);
 
   const handleFileSelect = (selectedFile: File) => {
@@ -61,7 +71,20 @@ const ComicUploadPage: React.FC = () => {
       setUploadError(null);
       setLoading(true);
       
-      const comic = await comicApi.uploadComic(file, title.trim());
+      let currentJob = await comicApi.uploadComic(file, title.trim());
+      setJob(currentJob);
+      
+      // Wait for the ingestion queue to process the comic
+      while (currentJob.status !== 'completed') {
+        if (currentJob.status === 'failed') {
+          throw new Error(currentJob.error || 'Processing failed');
+        }
+        await new Promise((resolve) => setTimeout(resolve, JOB_POLL_INTERVAL_MS));
+        currentJob = await comicApi.getIngestionJob(currentJob.id);
+        setJob(currentJob);
+      }
+      
+      const comic = await comicApi.getComic(currentJob.comic_id!);
       setCurrentComic(comic);
       
       // Navigate to character selection
@@ -71,6 +94,7 @@ const ComicUploadPage: React.FC = () => {
       console.error('Upload error:', error);
       setUploadError('Failed to upload comic. Please try again.');
     } finally {
+      setJob(null);
       setIsUploading(false);
       setLoading(false);
     }
@@ -213,8 +237,21 @@ const ComicUploadPage: React.FC = () => {
             animate={{ opacity: 1 }}
             className="mt-4 text-center text-sm text-gray-600"
           >
-            <p>Our AI is analyzing your comic...</p>
-            <p>This may take 30-60 seconds depending on comic length.</p>
+            {job && job.status === 'queued' ? (
+              <p>
+                Waiting in line ({job.queue_position ?? 0} pages ahead of yours)...
+              </p>
+            ) : (
+              <p>
+                Our AI is analyzing your comic...
+                {job && ` (page ${job.completed_pages} of ${job.total_pages})`}
+              </p>
+            )}
+            <p>
+              {job
+                ? `About ${formatEta(job.eta_seconds)} remaining.`
+                : 'Uploading your comic...'}
+            </p>
           </motion.div>
         )}
       </motion.div>
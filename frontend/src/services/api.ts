@@ -1,5 +1,5 @@
 import axios from 'axios';
-import { Comic, Session } from './types';
+import { Comic, IngestionJob, SearchEntry, Session } from './types';
 
 const API_BASE = '/api';
 
@@ -13,18 +13,23 @@ const api = axios.create({
 });
 
 export const comicApi = {
-  uploadComic: async (file: File, title: string): Promise<Comic> => {
+  uploadComic: async (file: File, title: string, lane: IngestionJob['lane'] = 'interactive'): Promise<IngestionJob> => {
     const formData = new FormData();
     formData.append('file', file);
-    formData.append('title', title);
     
     const response = await api.post('/comics/upload', formData, {
+      params: { title, lane },
       headers: {
         'Content-Type': 'multipart/form-data',
       },
     });
     
-    return response.data.comic;
+    return response.data.job;
+  },
+
+  getIngestionJob: async (jobId: string): Promise<IngestionJob> => {
+    const response = await api.get(`/comics/jobs/${jobId}`);
+    return response.data.job;
   },
 
   getComic: async (comicId: string): Promise<Comic> => {
@@ -73,4 +78,26 @@ export const sessionApi = {
   },
 };
 
+export const searchApi = {
+  searchDialogue: async (params: { q?: string; character?: string; comicId?: string; phrase?: boolean; limit?: number }): Promise<SearchEntry[]> => {
+    const response = await api.get('/search/', {
+      params: {
+        q: params.q,
+        character: params.character,
+        comic_id: params.comicId,
+        phrase: params.phrase,
+        limit: params.limit,
+      },
+    });
+    return response.data.results;
+  },
+
+  findPage: async (comicId: string, q: string): Promise<number> => {
+    const response = await api.get(`/search/comics/${comicId}/page`, {
+      params: { q },
+    });
+    return response.data.page_number;
+  },
+};
+
 export default api;
\ No newline at end of file
@@ -46,6 +46,36 @@ export interface Session {
   created_at?: string;
 }
 
+export interface IngestionJob {
+  id: string;
+  user_id: string;
+  title: string;
+  lane: 'interactive' | 'bulk';
+  status: 'queued' | 'processing' | 'completed' | 'failed';
+  total_pages: number;
+  completed_pages: number;
+  queue_position?: number;
+  eta_seconds?: number;
+  comic_id?: string;
+  error?: string;
+  created_at?: string;
+}
+
+export interface SearchEntry {
+  id: string;
+  comic_id: string;
+  user_id: string;
+  page_number: number;
+  panel_id: string;
+  panel_order: number;
+  bubble_id: string;
+  bubble_order: number;
+  character: string;
+  character_key: string;
+  bubble_type: ComicBubble['bubble_type'];
+  text: string;
+}
+
 export interface CharacterAssignment {
   player_name: string;
   characters: string[];